@@ -5,9 +5,22 @@ A Streamlit app for searching tech content using Serper API and YouTube transcri
 
 import streamlit as st
 import asyncio
+import html
 import logging
+import math
+import re
+import weakref
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +31,50 @@ from core.models import SearchQuery, SearchResult, SearchProvider, TechDomain
 from services import search_service
 from config import settings, validate_required_keys
 
+RESULTS_PER_PAGE = 10
+YOUTUBE_URL_PATTERN = re.compile(r"youtube\.com|youtu\.be", re.IGNORECASE)
+VIDEO_ID_PATTERN = re.compile(
+    r"(?:[?&]v=|youtu\.be/|/(?:embed|shorts|live)/)([\w-]{11})|^([\w-]{11})$"
+)
+PROVIDER_BADGES = {
+    p: f'<div class="provider-badge {p.value.lower()}-badge">{p.value.upper()}</div>'
+    for p in SearchProvider
+}
+
+# Custom CSS, injected by inject_css() on every full script run
+CUSTOM_CSS = """
+<style>
+.result-card {
+    background-color: white;
+    padding: 15px;
+    border-radius: 8px;
+    border-left: 4px solid #4CAF50;
+    margin-bottom: 15px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.provider-badge {
+    background-color: #e3f2fd;
+    color: #1976d2;
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 12px;
+    font-weight: bold;
+    display: inline-block;
+    margin-bottom: 10px;
+}
+.tavily-badge { background-color: #9c27b0; color: white; }
+.groq-badge { background-color: #ff6b35; color: white; }
+.youtube-badge { background-color: #ff0000; color: white; }
+.result-info {
+    background-color: #e8f4fd;
+    color: #0c5460;
+    padding: 8px 12px;
+    border-radius: 6px;
+    margin-bottom: 10px;
+}
+</style>
+"""
+
 # Page config
 st.set_page_config(
     page_title="Tech Search Engine",
@@ -31,10 +88,38 @@ def init_session_state():
     if "search_results" not in st.session_state:
         st.session_state.search_results = []
     if "search_history" not in st.session_state:
-        st.session_state.search_history = []
+        st.session_state.search_history = deque(maxlen=10)
     if "last_query" not in st.session_state:
         st.session_state.last_query = ""
 
+class SessionLoop:
+    """Owns a session's event loop and closes it once the session is gone.
+
+    The finalizer runs when Streamlit drops the session's state, or at
+    interpreter exit for sessions still alive then.
+    """
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the session's event loop, creating it on first use.
+
+    The same loop is reused across reruns, so a provider search still in
+    flight from an earlier run can be joined by a later one instead of
+    being lost with a throwaway ``asyncio.run`` loop.
+    """
+    session_loop = st.session_state.get("_loop")
+    if session_loop is None or session_loop.loop.is_closed():
+        session_loop = SessionLoop()
+        st.session_state["_loop"] = session_loop
+    return session_loop.loop
+
+def inject_css():
+    """Inject the custom CSS."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
 def render_header():
     """Render the app header."""
     st.title("🔍 Tech Search Engine")
@@ -44,107 +129,227 @@ def render_header():
     - 🤖 **AI Analysis** (via Groq LLM)
     - 🎥 **YouTube Transcripts** (paste video URLs or IDs)
     """)
-    
-    # Custom CSS
-    st.markdown("""
-    <style>
-    .result-card {
-        background-color: white;
-        padding: 15px;
-        border-radius: 8px;
-        border-left: 4px solid #4CAF50;
-        margin-bottom: 15px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .provider-badge {
-        background-color: #e3f2fd;
-        color: #1976d2;
-        padding: 4px 8px;
-        border-radius: 12px;
-        font-size: 12px;
-        font-weight: bold;
-        display: inline-block;
-        margin-bottom: 10px;
-    }
-    .tavily-badge { background-color: #9c27b0; color: white; }
-    .groq-badge { background-color: #ff6b35; color: white; }
-    .youtube-badge { background-color: #ff0000; color: white; }
-    </style>
-    """, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def get_available_keys() -> Dict[str, bool]:
+    """Check the configured API keys once per server process."""
+    return validate_required_keys()
 
 def render_provider_status():
     """Show provider status."""
-    with st.expander("🔌 Provider Status", expanded=False):
-        available_keys = validate_required_keys()
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if available_keys["tavily"]:
-                st.success("✅ Tavily (Web Search): Ready")
-            else:
-                st.error("❌ Tavily: Missing API key")
-                st.info("Add your Tavily API key to .env file")
-            
-            if available_keys["groq"]:
-                st.success("✅ Groq (AI Analysis): Ready")
-            else:
-                st.error("❌ Groq: Missing API key")
-                st.info("Add your Groq API key to .env file")
+    # Unlike an expander body, this only runs while the panel is shown
+    if not st.toggle("🔌 Provider Status", key="show_provider_status"):
+        return
+    
+    available_keys = get_available_keys()
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if available_keys["tavily"]:
+            st.success("✅ Tavily (Web Search): Ready")
+        else:
+            st.error("❌ Tavily: Missing API key")
+            st.info("Add your Tavily API key to .env file")
         
-        with col2:
-            st.success("✅ YouTube Transcripts: Ready (no key required)")
+        if available_keys["groq"]:
+            st.success("✅ Groq (AI Analysis): Ready")
+        else:
+            st.error("❌ Groq: Missing API key")
+            st.info("Add your Groq API key to .env file")
+    
+    with col2:
+        st.success("✅ YouTube Transcripts: Ready (no key required)")
+
+PROVIDER_OPTIONS = {
+    "Tavily": SearchProvider.TAVILY,
+    "Groq": SearchProvider.GROQ,
+    "YouTube": SearchProvider.YOUTUBE,
+}
+
+def resolve_providers(query: str, provider: str) -> List[SearchProvider]:
+    """Map the selected provider option to the providers to query."""
+    if provider != "Auto":
+        return [PROVIDER_OPTIONS[provider]]
+    if YOUTUBE_URL_PATTERN.search(query):
+        return [SearchProvider.YOUTUBE]
+    return [SearchProvider.TAVILY, SearchProvider.GROQ]
+
+@lru_cache(maxsize=128)
+def extract_video_id(query: str) -> Optional[str]:
+    """Extract the video ID from a YouTube URL or bare ID."""
+    match = VIDEO_ID_PATTERN.search(query.strip())
+    if match:
+        return match.group(1) or match.group(2)
+    return None
+
+def dispatch_search(
+    query: str, provider: SearchProvider, num_results: int, domains: List[str]
+) -> "asyncio.Future[List[SearchResult]]":
+    """Start a provider search, or join the identical one already in flight."""
+    if provider == SearchProvider.YOUTUBE:
+        # Hand the provider a pre-parsed ID so any URL form of a video shares a key
+        query = extract_video_id(query) or query
+    
+    inflight = st.session_state.setdefault("_inflight", {})
+    key = (query, provider, num_results, tuple(domains))
+    future = inflight.get(key)
+    if future is None:
+        search_query = SearchQuery(
+            query=query,
+            domains=domains,
+            provider=provider,
+            limit=num_results
+        )
+        future = asyncio.ensure_future(
+            search_service.search(search_query, use_cache=True), loop=get_loop()
+        )
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    return future
+
+def result_key(result: SearchResult) -> str:
+    """Identify a result by its URL, ignoring case of the host, fragments and trailing slashes."""
+    if not result.url:
+        return result.title
+    parts = urlsplit(str(result.url))
+    path = parts.path.rstrip("/")
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}{query}"
+
+async def provider_outcome(
+    provider: SearchProvider, future: "asyncio.Future[List[SearchResult]]"
+) -> Tuple[SearchProvider, Any]:
+    """Await a provider's search, returning its batch or the exception it raised."""
+    try:
+        return provider, await future
+    except Exception as e:
+        return provider, e
 
-def perform_search(query: str, provider: str, num_results: int, domains: List[str]):
-    """Perform the search operation."""
+async def search_stream(
+    query: str, providers: List[SearchProvider], num_results: int, domains: List[str]
+) -> AsyncIterator[Tuple[SearchProvider, Any]]:
+    """Query the given providers concurrently, yielding each batch as it returns.
+
+    Yields ``(provider, batch)`` pairs; a provider that failed yields its
+    exception in place of the batch.
+    """
+    outcomes = [
+        provider_outcome(p, dispatch_search(query, p, num_results, domains))
+        for p in providers
+    ]
+    for next_outcome in asyncio.as_completed(outcomes):
+        yield await next_outcome
+
+def merge_results(
+    providers: List[SearchProvider], batches: Dict[SearchProvider, List[SearchResult]]
+) -> List[SearchResult]:
+    """Merge provider batches in ``providers`` order, keeping the first of any duplicates."""
+    merged: Dict[str, SearchResult] = {}
+    for provider in providers:
+        for result in batches.get(provider, []):
+            merged.setdefault(result_key(result), result)
+    return list(merged.values())
+
+def stream_search(
+    query: str, providers: List[SearchProvider], num_results: int, domains: List[str]
+) -> Tuple[List[SearchResult], List[SearchProvider]]:
+    """Run a search, previewing each provider's results as soon as it returns.
+
+    Returns the merged results along with the providers that failed.
+    """
+    loop = get_loop()
+    stream = search_stream(query, providers, num_results, domains)
+    placeholder = st.empty()
+    batches: Dict[SearchProvider, List[SearchResult]] = {}
+    errors: Dict[SearchProvider, Exception] = {}
+    while True:
+        try:
+            provider, batch = loop.run_until_complete(stream.__anext__())
+        except StopAsyncIteration:
+            break
+        if isinstance(batch, Exception):
+            logger.warning(f"{provider.value} search failed: {str(batch)}")
+            errors[provider] = batch
+            continue
+        batches[provider] = batch
+        placeholder.markdown(
+            "\n<hr>\n".join(result_card_html(r) for r in merge_results(providers, batches)),
+            unsafe_allow_html=True
+        )
+    placeholder.empty()
+    
+    # Only surface an error if every provider failed
+    if errors and not batches:
+        raise next(iter(errors.values()))
+    return merge_results(providers, batches), list(errors)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def cached_search(
+    query: str,
+    provider: str,
+    num_results: int,
+    domains: Tuple[str, ...],
+    _results: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """Memoize search results in process memory.
+
+    Pass ``_results`` to store a finished search. Without them a cache miss
+    raises ``LookupError``; exceptions are never cached, so the caller can
+    stream the search itself and store the results afterwards. Results are
+    cached as plain dicts so Streamlit doesn't have to pickle models.
+    """
+    if _results is None:
+        raise LookupError(query)
+    return _results
+
+def perform_search(query: str, provider: str, num_results: int, domains: List[str]) -> bool:
+    """Perform the search operation, returning whether new results were stored."""
     if not query.strip():
         st.error("Please enter a search query")
-        return
+        return False
     
-    # Determine provider
-    search_provider = None
-    if provider == "Tavily":
-        search_provider = SearchProvider.TAVILY
-    elif provider == "Groq":
-        search_provider = SearchProvider.GROQ
-    elif provider == "YouTube":
-        search_provider = SearchProvider.YOUTUBE
-    
-    # Create search query
-    search_query = SearchQuery(
-        query=query.strip(),
-        domains=domains,
-        provider=search_provider,
-        limit=num_results
-    )
+    providers = resolve_providers(query, provider)
+    cache_key = (query.strip(), provider, num_results, tuple(domains))
     
     # Show loading
-    with st.spinner(f"🔍 Searching with {provider}..."):
+    with st.spinner(f"🔍 Searching with {', '.join(p.value for p in providers)}..."):
         try:
             # Perform search
-            results = asyncio.run(search_service.search(search_query, use_cache=True))
+            try:
+                cached = cached_search(*cache_key)
+                results = [SearchResult.model_validate(data) for data in cached]
+                failed = []
+            except LookupError:
+                results, failed = stream_search(query.strip(), providers, num_results, domains)
+                # Don't pin partial results for every session when a provider failed
+                if not failed:
+                    cached_search(
+                        *cache_key,
+                        _results=[result.model_dump(mode="json") for result in results]
+                    )
             
             # Update session state
             st.session_state.search_results = results
+            st.session_state.pop("filtered_results", None)
+            st.session_state.results_page = 1
             st.session_state.last_query = query
+            st.session_state.search_status = (len(results), [p.value for p in failed])
             
             # Add to history
-            st.session_state.search_history.insert(0, {
+            st.session_state.search_history.appendleft({
                 "query": query,
                 "provider": provider,
                 "results_count": len(results),
                 "timestamp": datetime.now()
             })
-            st.session_state.search_history = st.session_state.search_history[:10]
-            
-            if results:
-                st.success(f"✅ Found {len(results)} results!")
-            else:
-                st.warning("⚠️ No results found. Try a different query.")
+            return True
                 
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             st.error(f"❌ Search failed: {str(e)}")
+            return False
 
+@st.fragment
 def render_search_interface():
     """Render the search interface."""
     st.subheader("🔎 Search")
@@ -170,7 +375,7 @@ def render_search_interface():
         with col1:
             provider = st.selectbox(
                 "Provider",
-                options=["Auto", "Tavily", "Groq", "YouTube"],
+                options=["Auto"] + list(PROVIDER_OPTIONS),
                 help="Choose search provider or auto-detect"
             )
         
@@ -192,41 +397,60 @@ def render_search_interface():
     
     # Handle search
     if search_button and query.strip():
-        # Auto-detect provider if needed
-        if provider == "Auto":
-            if any(pattern in query.lower() for pattern in ["youtube.com", "youtu.be"]):
-                provider = "YouTube"
-            else:
-                provider = "Tavily"
-        
-        perform_search(query, provider, num_results, domains)
+        if perform_search(query, provider, num_results, domains):
+            # Results and history are rendered by other fragments
+            st.rerun()
 
-def render_result_card(result: SearchResult, index: int):
-    """Render a single search result."""
-    # Provider badge
-    provider_class = f"{result.provider.value.lower()}-badge"
-    st.markdown(f"""
-    <div class="provider-badge {provider_class}">
-        {result.provider.value.upper()}
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Title and URL
+def is_transcript(result: SearchResult) -> bool:
+    """Whether the result is a YouTube transcript."""
+    return result.provider == SearchProvider.YOUTUBE and result.metadata.get("type") == "transcript"
+
+def is_analysis(result: SearchResult) -> bool:
+    """Whether the result is a Groq AI analysis."""
+    return result.provider == SearchProvider.GROQ and result.metadata.get("type") == "ai_analysis"
+
+def result_card_html(result: SearchResult) -> str:
+    """Build the static part of a result card as a single markdown string.
+
+    The badge and title form one HTML block. The snippet follows as
+    HTML-escaped markdown in its own paragraph, so LLM-written snippets
+    keep their formatting.
+    """
+    html_parts = [PROVIDER_BADGES[result.provider]]
+    
+    title = html.escape(result.title)
     if result.url:
-        st.markdown(f"### [{result.title}]({result.url})")
+        html_parts.append(f'<h3><a href="{html.escape(str(result.url))}">{title}</a></h3>')
     else:
-        st.markdown(f"### {result.title}")
+        html_parts.append(f"<h3>{title}</h3>")
+    
+    # Blank lines end the HTML block so the snippet is parsed as markdown
+    blocks = ["\n".join(html_parts)]
     
-    # Snippet
     if result.snippet:
-        st.write(result.snippet)
+        blocks.append(html.escape(result.snippet))
     
-    # Special handling for YouTube transcripts
-    if result.provider == SearchProvider.YOUTUBE and result.metadata.get("type") == "transcript":
-        transcript_length = result.metadata.get("transcript_length", 0)
-        st.info(f"📝 Transcript available with {transcript_length} segments")
-        
-        # Show transcript preview
+    if is_transcript(result):
+        transcript_length = html.escape(str(result.metadata.get("transcript_length", 0)))
+        blocks.append(
+            f'<div class="result-info">📝 Transcript available with {transcript_length} segments</div>'
+        )
+    elif is_analysis(result):
+        tokens_used = html.escape(str(result.metadata.get("tokens_used", 0)))
+        model_used = html.escape(str(result.metadata.get("model_used", "unknown")))
+        blocks.append(
+            f'<div class="result-info">🤖 AI Analysis • Model: {model_used} • Tokens: {tokens_used}</div>'
+        )
+    
+    return "\n\n".join(blocks)
+
+def render_result_card(result: SearchResult, index: int):
+    """Render a single search result."""
+    # Static content goes out as a single markdown element
+    st.markdown(result_card_html(result), unsafe_allow_html=True)
+    
+    # Expensive panels are only rendered on demand
+    if is_transcript(result):
         if st.checkbox(f"Show full transcript", key=f"transcript_{index}"):
             full_transcript = result.metadata.get("full_transcript", "")
             st.text_area(
@@ -235,14 +459,7 @@ def render_result_card(result: SearchResult, index: int):
                 height=200,
                 key=f"transcript_text_{index}"
             )
-    
-    # Special handling for Groq AI analysis
-    elif result.provider == SearchProvider.GROQ and result.metadata.get("type") == "ai_analysis":
-        tokens_used = result.metadata.get("tokens_used", 0)
-        model_used = result.metadata.get("model_used", "unknown")
-        st.info(f"🤖 AI Analysis • Model: {model_used} • Tokens: {tokens_used}")
-        
-        # Show full analysis
+    elif is_analysis(result):
         if st.checkbox(f"Show full analysis", key=f"analysis_{index}"):
             full_analysis = result.metadata.get("full_analysis", "")
             st.markdown(full_analysis)
@@ -253,9 +470,23 @@ def render_result_card(result: SearchResult, index: int):
     
     st.divider()
 
+@st.fragment
 def render_results():
     """Render search results."""
+    # One-shot status left by the search that produced these results
+    status = st.session_state.pop("search_status", None)
+    if status is not None:
+        results_count, failed = status
+        if failed:
+            st.warning(f"⚠️ {', '.join(failed)} failed; showing partial results.")
+        if results_count:
+            st.success(f"✅ Found {results_count} results!")
+        else:
+            st.warning("⚠️ No results found. Try a different query.")
+    
     if not st.session_state.search_results:
+        if status is not None:
+            return
         if st.session_state.last_query:
             st.info("No results to display.")
         else:
@@ -284,103 +515,138 @@ def render_results():
             key="show_transcripts"
         )
     
-    # Apply filters
-    filtered_results = results
-    if provider_filter != "All":
-        filtered_results = [r for r in results if r.provider.value == provider_filter]
+    # Apply filters, reusing the previous list unless the filter changed
+    filter_key = (provider_filter, len(results))
+    cached_filter = st.session_state.get("filtered_results")
+    if cached_filter and cached_filter[0] == filter_key:
+        filtered_results = cached_filter[1]
+    else:
+        # A different filter starts again from the first page
+        if cached_filter and cached_filter[0][0] != provider_filter:
+            st.session_state.results_page = 1
+        filtered_results = results
+        if provider_filter != "All":
+            filtered_results = [r for r in results if r.provider.value == provider_filter]
+        st.session_state.filtered_results = (filter_key, filtered_results)
     
     # Display results
     st.subheader(f"📋 Results ({len(filtered_results)})")
     
-    for i, result in enumerate(filtered_results):
+    # Only render the cards on the current page
+    num_pages = max(1, math.ceil(len(filtered_results) / RESULTS_PER_PAGE))
+    if st.session_state.get("results_page", 1) > num_pages:
+        st.session_state.results_page = 1
+    page = 1
+    if num_pages > 1:
+        page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=num_pages,
+            step=1,
+            help=f"{num_pages} pages of {RESULTS_PER_PAGE} results",
+            key="results_page"
+        )
+    
+    start = (page - 1) * RESULTS_PER_PAGE
+    page_results = filtered_results[start:start + RESULTS_PER_PAGE]
+    for i, result in enumerate(page_results, start=start):
         with st.container():
             render_result_card(result, i)
 
+@st.fragment
 def render_sidebar():
     """Render sidebar with tools and info."""
-    with st.sidebar:
-        st.header("🛠️ Tools")
-        
-        # Quick search examples
-        st.subheader("💡 Try These Examples")
-        examples = [
-            "artificial intelligence trends",
-            "blockchain development",
-            "quantum computing basics",
-            "cybersecurity best practices",
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ"  # Example YouTube URL
-        ]
-        
-        for example in examples:
-            if st.button(example, key=f"example_{example[:20]}"):
-                st.session_state.last_query = example
+    st.header("🛠️ Tools")
+    
+    # Quick search examples
+    st.subheader("💡 Try These Examples")
+    examples = [
+        "artificial intelligence trends",
+        "blockchain development",
+        "quantum computing basics",
+        "cybersecurity best practices",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ"  # Example YouTube URL
+    ]
+    
+    for example in examples:
+        if st.button(example, key=f"example_{example[:20]}"):
+            st.session_state.last_query = example
+            st.rerun()
+    
+    # Search history
+    if st.session_state.search_history:
+        st.subheader("📚 Recent Searches")
+        for i, entry in enumerate(islice(st.session_state.search_history, 5)):
+            timestamp = entry["timestamp"].strftime("%H:%M")
+            if st.button(
+                f"{entry['query'][:25]}..." if len(entry['query']) > 25 else entry['query'],
+                key=f"history_{i}",
+                help=f"{timestamp} • {entry['results_count']} results"
+            ):
+                st.session_state.last_query = entry['query']
                 st.rerun()
-        
-        # Search history
-        if st.session_state.search_history:
-            st.subheader("📚 Recent Searches")
-            for i, entry in enumerate(st.session_state.search_history[:5]):
-                timestamp = entry["timestamp"].strftime("%H:%M")
-                if st.button(
-                    f"{entry['query'][:25]}..." if len(entry['query']) > 25 else entry['query'],
-                    key=f"history_{i}",
-                    help=f"{timestamp} • {entry['results_count']} results"
-                ):
-                    st.session_state.last_query = entry['query']
-                    st.rerun()
-        
-        # Cache management
-        st.subheader("💾 Cache")
-        if st.button("🗑️ Clear Cache"):
-            with st.spinner("Clearing cache..."):
-                try:
-                    cleared = search_service.cleanup_cache()
-                    st.success(f"Cleared {cleared} cache entries")
-                except Exception as e:
-                    st.error(f"Cache cleanup failed: {str(e)}")
-        
-        # Export
-        if st.session_state.search_results:
-            st.subheader("📤 Export")
-            if st.button("📋 Copy Results"):
+    
+    # Cache management
+    st.subheader("💾 Cache")
+    if st.button("🗑️ Clear Cache"):
+        with st.spinner("Clearing cache..."):
+            try:
+                cleared = search_service.cleanup_cache()
+                cached_search.clear()
+                st.success(f"Cleared {cleared} cache entries")
+            except Exception as e:
+                st.error(f"Cache cleanup failed: {str(e)}")
+    
+    # Export
+    if st.session_state.search_results:
+        st.subheader("📤 Export")
+        if st.button("📋 Copy Results"):
+            data = [
+                {
+                    "title": result.title,
+                    "url": str(result.url),
+                    "snippet": result.snippet,
+                    "provider": result.provider.value
+                }
+                for result in st.session_state.search_results
+            ]
+            
+            if orjson is not None:
+                json_str = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            else:
                 import json
-                data = []
-                for result in st.session_state.search_results:
-                    data.append({
-                        "title": result.title,
-                        "url": str(result.url),
-                        "snippet": result.snippet,
-                        "provider": result.provider.value
-                    })
-                
                 json_str = json.dumps(data, indent=2)
-                st.code(json_str, language="json")
-        
-        # App info
-        st.subheader("ℹ️ About")
-        st.markdown("""
-        **Tech Search Engine** v1.0
-        
-        A proof-of-concept built with:
-        - 🔍 Serper API (Google Search)
-        - 🎥 YouTube Transcript API
-        - ⚡ Streamlit + Python
-        - 💾 SQLite caching
-        
-        **Setup:**
-        1. Get Serper API key from serper.dev
-        2. Add to `.env` file
-        3. Run with `streamlit run app.py`
-        """)
+            st.code(json_str, language="json")
+    
+    # App info
+    st.subheader("ℹ️ About")
+    st.markdown("""
+    **Tech Search Engine** v1.0
+    
+    A proof-of-concept built with:
+    - 🔍 Serper API (Google Search)
+    - 🎥 YouTube Transcript API
+    - ⚡ Streamlit + Python
+    - 💾 SQLite caching
+    
+    **Setup:**
+    1. Get Serper API key from serper.dev
+    2. Add to `.env` file
+    3. Run with `streamlit run app.py`
+    """)
 
 def main():
     """Main application function."""
     init_session_state()
+    inject_css()
     render_header()
     render_provider_status()
     render_search_interface()
     render_results()
-    render_sidebar()
+    
+    # Fragments can't write to st.sidebar themselves
+    with st.sidebar:
+        render_sidebar()
 
 if __name__ == "__main__":
     main()
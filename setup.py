@@ -2,6 +2,7 @@
 
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 def create_env_file():
@@ -11,7 +12,7 @@ def create_env_file():
     
     if not env_file.exists() and env_example.exists():
         print("Creating .env file from template...")
-        env_file.write_text(env_example.read_text())
+        env_file.write_bytes(env_example.read_bytes())
         print("✅ .env file created. Please edit it with your API keys.")
         return True
     elif not env_file.exists():
@@ -33,20 +34,14 @@ def check_dependencies():
         "python-dotenv"
     ]
     
-    missing_packages = []
+    # Packages whose import name isn't just the name with "-" replaced by "_"
+    module_names = {"python-dotenv": "dotenv"}
     
-    for package in required_packages:
-        try:
-            if package == "python-dotenv":
-                __import__("dotenv")
-            elif package == "youtube-transcript-api":
-                __import__("youtube_transcript_api")
-            elif package == "pydantic-settings":
-                __import__("pydantic_settings")
-            else:
-                __import__(package.replace("-", "_"))
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the module, it doesn't import it
+    missing_packages = [
+        package for package in required_packages
+        if find_spec(module_names.get(package, package.replace("-", "_"))) is None
+    ]
     
     if missing_packages:
         print("❌ Missing packages:")